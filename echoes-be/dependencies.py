@@ -4,12 +4,44 @@ ECHOES FastAPI Dependencies
 Provides dependency injection for the ECHOES translation service.
 """
 
+import re
+import sys
 from typing import Optional, Callable
+from functools import lru_cache
+
 from fastapi import Depends, Header
 
 from .services.echoes_service import EchoesService, get_echoes_service
 
 
+# Matches the primary language subtag at the start of an Accept-Language
+# header (e.g. 'en' from 'en-US,en;q=0.9,pt;q=0.8') in a single pass.
+_ACCEPT_PRIMARY_RE = re.compile(r"[ \t]*([A-Za-z]{1,8})")
+
+
+@lru_cache(maxsize=256)
+def _primary_language(accept_language: str) -> str:
+    """
+    Extract the lowercased primary language subtag from an Accept-Language
+    header value.
+
+    Browsers send a small, highly repetitive set of header values, so the
+    parse result is memoized on the raw header string.
+
+    Args:
+        accept_language: Raw Accept-Language header value
+
+    Returns:
+        Primary language code, or 'en' if the header is unparseable
+    """
+    match = _ACCEPT_PRIMARY_RE.match(accept_language)
+    if match:
+        # Interned so downstream dict lookups and comparisons can
+        # short-circuit on identity
+        return sys.intern(match.group(1).lower())
+    return "en"
+
+
 def get_locale(
     accept_language: Optional[str] = Header(None, alias="Accept-Language"),
     x_locale: Optional[str] = Header(None, alias="X-Locale")
@@ -31,20 +63,44 @@ def get_locale(
     """
     # X-Locale takes priority (explicit user preference)
     if x_locale:
+        # Fast path: already a bare base locale like 'en' — skip the
+        # split/lower allocations for the overwhelmingly common case
+        if len(x_locale) == 2 and x_locale.isascii() and x_locale.islower():
+            return sys.intern(x_locale)
         # Normalize to base locale
-        return x_locale.split("-")[0].lower()
+        return sys.intern(x_locale.split("-")[0].lower())
 
     if accept_language:
-        # Parse Accept-Language header
-        # Example: "en-US,en;q=0.9,pt;q=0.8"
-        locales = accept_language.split(",")
-        if locales:
-            primary = locales[0].split(";")[0].strip()
-            return primary.split("-")[0].lower()
+        # Same fast path for a bare 'en'-style header
+        if len(accept_language) == 2 and accept_language.isascii() and accept_language.islower():
+            return sys.intern(accept_language)
+        # Single regex match instead of split(",")/split(";")/split("-")
+        # chains; results are memoized per header value
+        return _primary_language(accept_language)
 
     return "en"
 
 
+@lru_cache(maxsize=64)
+def _cached_translator(
+    service: EchoesService,
+    locale: str
+) -> Callable[[str, Optional[dict]], str]:
+    """
+    Build (once per locale) a translate function bound to a locale.
+
+    The service is a long-lived singleton and locales are a small bounded
+    set, so caching here avoids allocating a fresh closure per request.
+    """
+    def translate(key: str, params: Optional[dict] = None) -> str:
+        # Plain labels skip the interpolation machinery entirely
+        if params is None:
+            return service.translate_raw(key, locale)
+        return service.translate(key, locale, params)
+
+    return translate
+
+
 def get_translator(
     locale: str = Depends(get_locale),
     service: EchoesService = Depends(get_echoes_service)
@@ -64,10 +120,7 @@ def get_translator(
     Returns:
         A translate function bound to the request locale
     """
-    def translate(key: str, params: Optional[dict] = None) -> str:
-        return service.translate(key, locale, params)
-
-    return translate
+    return _cached_translator(service, locale)
 
 
 class LocaleContext:
@@ -77,6 +130,8 @@ class LocaleContext:
     Useful when you need access to multiple translation features.
     """
 
+    __slots__ = ("locale", "_service")
+
     def __init__(self, locale: str, service: EchoesService):
         self.locale = locale
         self._service = service
@@ -102,6 +157,17 @@ class LocaleContext:
         return self._service.format_currency(value, self.locale, currency)
 
 
+@lru_cache(maxsize=128)
+def _cached_locale_context(service: EchoesService, locale: str) -> LocaleContext:
+    """
+    Build (once per locale) a LocaleContext bound to a locale.
+
+    LocaleContext holds no per-request state, so instances are shared
+    across requests instead of allocated per dependency resolution.
+    """
+    return LocaleContext(locale, service)
+
+
 def get_locale_context(
     locale: str = Depends(get_locale),
     service: EchoesService = Depends(get_echoes_service)
@@ -123,4 +189,4 @@ def get_locale_context(
     Returns:
         LocaleContext bound to the request locale
     """
-    return LocaleContext(locale, service)
+    return _cached_locale_context(service, locale)
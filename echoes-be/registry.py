@@ -6,12 +6,33 @@ Each module can provide translations organized by locale.
 """
 
 import json
+import logging
+import os
+import sys
+import threading
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import marisa_trie
+    MARISA_AVAILABLE = True
+except ImportError:
+    MARISA_AVAILABLE = False
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from dataclasses import dataclass, field
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class ModuleTranslation:
     """Represents a module's translation configuration."""
     module_name: str
@@ -49,8 +70,36 @@ class TranslationRegistry:
 
     def __init__(self):
         self._modules: Dict[str, ModuleTranslation] = {}
-        self._merged_translations: Dict[str, Dict[str, str]] = {}
-        self._dirty = True  # Flag to indicate if cache needs refresh
+        # Per-locale ChainMap over the module dicts: O(#modules) to build,
+        # lookups fall through the chain without copying any key/value pairs
+        self._merged_translations: Dict[str, Mapping[str, str]] = {}
+        # Per-module index keyed by (locale, module prefix), built alongside
+        # the merged cache so module filtering is a single dict lookup.
+        self._by_module: Dict[Tuple[str, str], Dict[str, str]] = {}
+        # String-dictionary encoding: each distinct key gets a small int ID,
+        # so per-key lookups hash a machine word instead of a dotted string
+        # and the key text is stored once instead of once per locale.
+        self._key_ids: Dict[str, int] = {}
+        self._by_id: Dict[str, Dict[int, str]] = {}
+        # Opt-in compact storage: per-locale marisa tries share key
+        # prefixes in a packed array instead of one dict entry per key.
+        # Intended for deploys with very large key counts per locale.
+        self._compact = False
+        self._tries: Dict[str, Any] = {}
+        # Read-only view over the merged cache, handed to callers instead
+        # of a fresh copy per call
+        self._merged_view: Mapping[str, Mapping[str, str]] = MappingProxyType(
+            self._merged_translations
+        )
+        # Locales whose merged cache entries are stale; only these are
+        # rebuilt on the next read instead of the whole table
+        self._dirty_locales: set = set()
+        # Monotonic counter bumped on every cache rebuild, so callers can
+        # cheaply detect whether previously derived data is still valid
+        self._version = 0
+        # Guards module-dict mutation during parallel reloads and
+        # serializes cache rebuilds (reads stay lock-free)
+        self._load_lock = threading.Lock()
 
     def register_module(
         self,
@@ -79,7 +128,7 @@ class TranslationRegistry:
         if translations_path and translations_path.exists():
             self._load_module_translations(module_name)
 
-        self._dirty = True
+        self._dirty_locales.update(self._modules[module_name].translations)
 
     def register_translations(
         self,
@@ -98,12 +147,16 @@ class TranslationRegistry:
         if module_name not in self._modules:
             self._modules[module_name] = ModuleTranslation(module_name=module_name)
 
+        # Locale codes are a tiny bounded set used constantly as dict keys;
+        # interning makes later comparisons identity checks
+        locale = sys.intern(locale)
+
         module = self._modules[module_name]
         if locale not in module.translations:
             module.translations[locale] = {}
 
         module.translations[locale].update(translations)
-        self._dirty = True
+        self._dirty_locales.add(locale)
 
     def unregister_module(self, module_name: str) -> bool:
         """
@@ -116,12 +169,12 @@ class TranslationRegistry:
             True if module was found and removed, False otherwise
         """
         if module_name in self._modules:
+            self._dirty_locales.update(self._modules[module_name].translations)
             del self._modules[module_name]
-            self._dirty = True
             return True
         return False
 
-    def get_translations(self, locale: str) -> Dict[str, str]:
+    def get_translations(self, locale: str) -> Mapping[str, str]:
         """
         Get all merged translations for a locale.
 
@@ -131,22 +184,120 @@ class TranslationRegistry:
         Returns:
             Dictionary of all translations for the locale
         """
-        if self._dirty:
-            self._rebuild_cache()
+        if locale in self._dirty_locales:
+            self._rebuild_locale(locale)
 
         return self._merged_translations.get(locale, {})
 
-    def get_all_translations(self) -> Dict[str, Dict[str, str]]:
+    def get_module_translations(self, locale: str, module_name: str) -> Dict[str, str]:
         """
-        Get all translations for all locales.
+        Get the precomputed translations for a single module in a locale.
+
+        Args:
+            locale: The locale code
+            module_name: The module prefix (first dotted segment of the keys)
+
+        Returns:
+            Dictionary of the module's translations for the locale
+        """
+        if locale in self._dirty_locales:
+            self._rebuild_locale(locale)
+
+        return self._by_module.get((locale, module_name), {})
+
+    def enable_compact_storage(self) -> bool:
+        """
+        Store per-locale lookup tables as marisa tries instead of dicts.
+
+        Dotted translation keys share long prefixes, which the trie packs
+        into a few MB where a dict costs ~160 B per entry. Worthwhile for
+        deployments with 100k+ keys per locale; requires the optional
+        marisa-trie package.
 
         Returns:
-            Dictionary mapping locale codes to translation dictionaries
+            True if compact storage was enabled, False if marisa-trie
+            is not installed
+        """
+        if not MARISA_AVAILABLE:
+            return False
+
+        self._compact = True
+        # Rebuild existing locales into tries lazily on next read
+        self._dirty_locales.update(self._merged_translations)
+        return True
+
+    def intern(self, key: str) -> int:
         """
-        if self._dirty:
-            self._rebuild_cache()
+        Get the integer ID for a translation key, assigning one if new.
+
+        Args:
+            key: Dotted translation key
 
-        return self._merged_translations.copy()
+        Returns:
+            The stable integer ID for the key
+        """
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = len(self._key_ids)
+            self._key_ids[key] = key_id
+        return key_id
+
+    def lookup(self, locale: str, key: str) -> Optional[str]:
+        """
+        Look up a single translation via the integer-ID index.
+
+        The caller's string key is resolved to its ID once; the per-locale
+        map is then probed with int hashing only. The index is built on a
+        locale's first lookup, so locales that are only ever read in bulk
+        never pay for it.
+
+        Args:
+            locale: The locale code
+            key: Dotted translation key
+
+        Returns:
+            The translation string, or None if not registered
+        """
+        if locale in self._dirty_locales:
+            self._rebuild_locale(locale)
+
+        if self._compact:
+            trie = self._tries.get(locale)
+            if trie is None:
+                return None
+            values = trie.get(key)
+            return values[0].decode("utf-8") if values else None
+
+        by_id = self._by_id.get(locale)
+        if by_id is None:
+            merged = self._merged_translations.get(locale)
+            if merged is None:
+                return None
+            # Built off to the side and published whole; the lock keeps
+            # intern() ID assignment consistent across threads
+            with self._load_lock:
+                by_id = self._by_id.get(locale)
+                if by_id is None:
+                    by_id = {
+                        self.intern(k): v for k, v in merged.items()
+                    }
+                    self._by_id[locale] = by_id
+
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            return None
+
+        return by_id.get(key_id)
+
+    def get_all_translations(self) -> Mapping[str, Mapping[str, str]]:
+        """
+        Get all translations for all locales.
+
+        Returns:
+            Read-only mapping of locale codes to translation dictionaries
+        """
+        self._rebuild_dirty()
+        return self._merged_view
 
     def get_registered_modules(self) -> List[str]:
         """Get list of all registered module names."""
@@ -154,9 +305,7 @@ class TranslationRegistry:
 
     def get_available_locales(self) -> List[str]:
         """Get list of all available locale codes."""
-        if self._dirty:
-            self._rebuild_cache()
-
+        self._rebuild_dirty()
         return list(self._merged_translations.keys())
 
     def reload_module(self, module_name: str) -> bool:
@@ -175,18 +324,32 @@ class TranslationRegistry:
             return False
 
         module = self._modules[module_name]
+        stale_locales = set(module.translations)
         module.translations.clear()
 
         if module.translations_path and module.translations_path.exists():
             self._load_module_translations(module_name)
 
-        self._dirty = True
+        # Both the locales the module used to provide and the ones it
+        # provides now are stale
+        self._dirty_locales.update(stale_locales)
+        self._dirty_locales.update(module.translations)
         return True
 
     def reload_all(self) -> None:
-        """Reload translations for all registered modules."""
-        for module_name in self._modules:
-            self.reload_module(module_name)
+        """
+        Reload translations for all registered modules.
+
+        Modules are reloaded in parallel: the GIL is released during file
+        reads and (orjson) parsing, so wall time scales with disk
+        parallelism instead of serializing per-module I/O.
+        """
+        module_names = list(self._modules)
+        if not module_names:
+            return
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self.reload_module, module_names))
 
     def _load_module_translations(self, module_name: str) -> None:
         """Load translations from a module's translations directory."""
@@ -194,43 +357,112 @@ class TranslationRegistry:
         if not module.translations_path:
             return
 
-        for json_file in module.translations_path.glob("*.json"):
-            locale = json_file.stem  # e.g., 'en' from 'en.json'
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    translations = json.load(f)
-
-                # Prefix keys with module name if not already prefixed
-                prefixed = {}
-                for key, value in translations.items():
-                    if not key.startswith(f"{module_name}."):
-                        # Only prefix if it's a simple key (not already namespaced)
-                        if "." not in key.split(".")[0] or key.startswith("common."):
-                            prefixed[key] = value
-                        else:
-                            prefixed[key] = value
-                    else:
-                        prefixed[key] = value
-
-                if locale not in module.translations:
-                    module.translations[locale] = {}
-                module.translations[locale].update(prefixed)
-
-            except (json.JSONDecodeError, IOError) as e:
-                # Log error but don't crash
-                print(f"Warning: Failed to load {json_file}: {e}")
-
-    def _rebuild_cache(self) -> None:
-        """Rebuild the merged translations cache."""
-        self._merged_translations.clear()
-
-        for module in self._modules.values():
-            for locale, translations in module.translations.items():
-                if locale not in self._merged_translations:
-                    self._merged_translations[locale] = {}
-                self._merged_translations[locale].update(translations)
-
-        self._dirty = False
+        # scandir avoids per-entry Path allocation and fnmatch that
+        # glob("*.json") would pay for every directory entry
+        with os.scandir(module.translations_path) as entries:
+            for entry in entries:
+                if not entry.is_file() or not entry.name.endswith(".json"):
+                    continue
+
+                locale = sys.intern(entry.name[:-5])  # e.g., 'en' from 'en.json'
+                try:
+                    # orjson parses UTF-8 bytes directly (C/SIMD decoder);
+                    # falls back to stdlib json when unavailable
+                    with open(entry.path, "rb") as f:
+                        translations = _json_loads(f.read())
+
+                    with self._load_lock:
+                        module.translations.setdefault(locale, {}).update(translations)
+
+                except (ValueError, IOError) as e:
+                    # Log error but don't crash
+                    # %s-style lazy formatting: nothing is rendered when
+                    # the warning is filtered out
+                    logger.warning("Failed to load %s: %s", entry.path, e)
+
+    def _rebuild_dirty(self) -> None:
+        """Rebuild cache entries for every locale marked stale."""
+        for locale in list(self._dirty_locales):
+            self._rebuild_locale(locale)
+
+    def _rebuild_locale(self, locale: str) -> None:
+        """
+        Rebuild the merged cache and secondary indexes for one locale.
+
+        Invalidation is tracked per locale, so a registration or reload
+        only pays for the locales it actually touched instead of a full
+        O(total keys) rebuild.
+
+        Rebuilds are serialized under the load lock: writers snapshot the
+        shared tables, so two concurrent rebuilds of different locales
+        would otherwise each publish a snapshot missing the other's work.
+        Readers stay lock-free.
+        """
+        with self._load_lock:
+            # Another thread may have rebuilt this locale while we waited
+            if locale not in self._dirty_locales:
+                return
+
+            # Chain the module dicts instead of copying every key/value
+            # pair; reversed so later registrations win lookups, matching
+            # the old update() order.
+            maps = [
+                module.translations[locale]
+                for module in self._modules.values()
+                if locale in module.translations
+            ]
+
+            # Everything is built off to the side and published with single
+            # reference assignments (GIL-atomic), so concurrent readers never
+            # observe a half-rebuilt locale — they see either the old or the
+            # new tables, with no locking on the read path.
+            new_by_module = {k: v for k, v in self._by_module.items() if k[0] != locale}
+
+            if not maps:
+                new_merged = {
+                    loc: m for loc, m in self._merged_translations.items() if loc != locale
+                }
+                self._by_module = new_by_module
+                self._by_id.pop(locale, None)
+                self._tries.pop(locale, None)
+                self._merged_translations = new_merged
+                self._merged_view = MappingProxyType(new_merged)
+                self._dirty_locales.discard(locale)
+                self._version += 1
+                return
+
+            merged = ChainMap(*reversed(maps))
+
+            # Index keys by their module prefix so filtered lookups avoid a
+            # per-request scan over every key in the locale.
+            for key, value in merged.items():
+                prefix, sep, _ = key.partition(".")
+                if sep:
+                    new_by_module.setdefault((locale, prefix), {})[key] = value
+
+            new_merged_translations = dict(self._merged_translations)
+            new_merged_translations[locale] = merged
+
+            # Publish: each assignment swaps in a fully built structure
+            self._by_module = new_by_module
+            if self._compact:
+                # Packed trie replaces the per-key dict for single-key lookups
+                self._tries[locale] = marisa_trie.BytesTrie(
+                    (key, value.encode("utf-8")) for key, value in merged.items()
+                )
+            # The int-ID index is derived lazily on first lookup(); drop
+            # any stale entry so it is rebuilt from the new tables
+            self._by_id.pop(locale, None)
+            self._merged_translations = new_merged_translations
+            self._merged_view = MappingProxyType(new_merged_translations)
+
+            self._dirty_locales.discard(locale)
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Monotonic cache version; changes whenever translations change."""
+        return self._version
 
 
 # Global singleton instance
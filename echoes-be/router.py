@@ -8,8 +8,17 @@ from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel
 
+try:
+    # orjson-backed responses skip Pydantic validation and stdlib json
+    # encoding on the hot endpoints
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as FastJSONResponse
+
 from .services.echoes_service import EchoesService, get_echoes_service
 from .dependencies import get_locale, get_locale_context, LocaleContext
+from .registry import translation_registry
 
 
 router = APIRouter(prefix="/api/echoes", tags=["echoes", "i18n"])
@@ -79,6 +88,11 @@ class TranslateBatchResponse(BaseModel):
 # Endpoints
 # =============================================================================
 
+# Cached /locales response, keyed on (registry version, default locale) so
+# it is rebuilt only when translations actually change
+_locales_cache: Optional[tuple] = None
+
+
 @router.get("/locales", response_model=LocaleListResponse)
 def get_available_locales(
     service: EchoesService = Depends(get_echoes_service)
@@ -88,19 +102,32 @@ def get_available_locales(
 
     Returns all supported locales with their display names.
     """
+    global _locales_cache
+
+    cache_key = (translation_registry.version, service.default_locale)
+    if _locales_cache is not None and _locales_cache[0] == cache_key:
+        return _locales_cache[1]
+
     locales = service.get_available_locales()
-    return LocaleListResponse(
+    response = LocaleListResponse(
         locales=[LocaleInfo(**loc) for loc in locales],
         default=service.default_locale
     )
+    _locales_cache = (cache_key, response)
+    return response
 
 
-@router.get("/translations/{locale}", response_model=TranslationResponse)
+@router.get(
+    "/translations/{locale}",
+    response_model=None,
+    response_class=FastJSONResponse,
+    responses={200: {"model": TranslationResponse}},
+)
 def get_translations(
     locale: str,
     module: Optional[str] = Query(None, description="Filter by module name"),
     service: EchoesService = Depends(get_echoes_service)
-) -> TranslationResponse:
+) -> FastJSONResponse:
     """
     Get all translations for a specific locale.
 
@@ -109,21 +136,18 @@ def get_translations(
     # Ensure translations are loaded for this locale
     service.load_translations(locale)
 
-    translations = service._translations.get(locale, {})
-
-    # Filter by module if specified
     if module:
-        filtered = {}
-        prefix = f"{module}."
-        for key, value in translations.items():
-            if key.startswith(prefix):
-                filtered[key] = value
-        translations = filtered
-
-    return TranslationResponse(
-        locale=locale,
-        translations=translations
-    )
+        # Precomputed per-module index: O(1) instead of scanning every key
+        translations = service.get_module_translations(locale, module)
+    else:
+        translations = service._translations.get(locale, {})
+
+    # Serialize directly; for dicts of thousands of keys, re-walking the
+    # structure through Pydantic per request is pure overhead
+    return FastJSONResponse({
+        "locale": locale,
+        "translations": translations
+    })
 
 
 @router.post("/detect", response_model=DetectLocaleResponse)
@@ -145,12 +169,17 @@ def detect_locale(
     )
 
 
-@router.post("/translate", response_model=TranslateResponse)
+@router.post(
+    "/translate",
+    response_model=None,
+    response_class=FastJSONResponse,
+    responses={200: {"model": TranslateResponse}},
+)
 def translate_key(
     request: TranslateRequest,
     ctx: LocaleContext = Depends(get_locale_context),
     service: EchoesService = Depends(get_echoes_service)
-) -> TranslateResponse:
+) -> FastJSONResponse:
     """
     Translate a single key.
 
@@ -159,34 +188,36 @@ def translate_key(
     locale = request.locale or ctx.locale
     text = service.translate(request.key, locale, request.params)
 
-    return TranslateResponse(
-        key=request.key,
-        locale=locale,
-        text=text
-    )
+    return FastJSONResponse({
+        "key": request.key,
+        "locale": locale,
+        "text": text
+    })
 
 
-@router.post("/translate/batch", response_model=TranslateBatchResponse)
+@router.post(
+    "/translate/batch",
+    response_model=None,
+    response_class=FastJSONResponse,
+    responses={200: {"model": TranslateBatchResponse}},
+)
 def translate_batch(
     request: TranslateBatchRequest,
     ctx: LocaleContext = Depends(get_locale_context),
     service: EchoesService = Depends(get_echoes_service)
-) -> TranslateBatchResponse:
+) -> FastJSONResponse:
     """
     Translate multiple keys at once.
 
     Useful for fetching all translations needed for a page/component.
     """
     locale = request.locale or ctx.locale
-    translations = {}
+    translations = service.translate_many(request.keys, locale)
 
-    for key in request.keys:
-        translations[key] = service.translate(key, locale)
-
-    return TranslateBatchResponse(
-        locale=locale,
-        translations=translations
-    )
+    return FastJSONResponse({
+        "locale": locale,
+        "translations": translations
+    })
 
 
 @router.get("/current-locale")
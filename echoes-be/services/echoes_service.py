@@ -4,12 +4,32 @@ ECHOES Service - Backend Translation Service
 Provides translation and internationalization services for the Spark Framework.
 """
 
+import os
+import sys
+import mmap
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 from datetime import datetime, date
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 import json
+import logging
 import re
-from functools import lru_cache
+from functools import cache, lru_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Above this size, files are parsed through mmap instead of a full
+# read() so the bytes never pass through an intermediate Python buffer
+_MMAP_THRESHOLD = 1 << 20
+
+logger = logging.getLogger(__name__)
 
 try:
     from babel import Locale, numbers, dates
@@ -19,6 +39,211 @@ except ImportError:
     BABEL_AVAILABLE = False
 
 
+@lru_cache(maxsize=64)
+def _babel_locale(tag: str):
+    """
+    Parse a locale tag into a Babel Locale, cached per tag.
+
+    Locale.parse tokenizes and validates the tag on every call, which
+    dominates formatter cost for short values; the set of tags in play is
+    tiny, so this converges to pure cache hits.
+    """
+    return Locale.parse(tag.replace("-", "_"))
+
+
+@lru_cache(maxsize=32)
+def _decimal_pattern(decimal_places: int):
+    """
+    Build and parse the fixed-precision decimal pattern once per precision.
+
+    Babel re-parses a pattern string on every format_decimal call; keying
+    the parsed NumberPattern on the (small int) precision makes repeat
+    formats hit the cache every time.
+    """
+    pattern = "#,##0." + "0" * decimal_places if decimal_places else "#,##0"
+    return numbers.parse_pattern(pattern)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO-8601 string, memoized on the raw string.
+
+    Batch responses tend to repeat the same timestamps (e.g. 'today')
+    many times, so repeat parses become a dict hit.
+    """
+    return datetime.fromisoformat(value)
+
+
+# Simplified CLDR plural rules, one function per language family; the
+# count == 0 -> 'zero' case is handled before dispatch.
+
+def _default_plural(count: int) -> str:
+    """English, Portuguese, Spanish, German, Italian, etc."""
+    return "one" if count == 1 else "other"
+
+
+def _fr_plural(count: int) -> str:
+    """French: 0 and 1 are singular."""
+    return "one" if count in (0, 1) else "other"
+
+
+def _ru_plural(count: int) -> str:
+    """Russian: complex rules."""
+    mod10 = count % 10
+    mod100 = count % 100
+    if mod10 == 1 and mod100 != 11:
+        return "one"
+    if 2 <= mod10 <= 4 and not (12 <= mod100 <= 14):
+        return "few"
+    return "many"
+
+
+def _ar_plural(count: int) -> str:
+    """Arabic: most complex."""
+    if count == 0:
+        return "zero"
+    if count == 1:
+        return "one"
+    if count == 2:
+        return "two"
+    mod100 = count % 100
+    if 3 <= mod100 <= 10:
+        return "few"
+    if 11 <= mod100:
+        return "many"
+    return "other"
+
+
+_PLURAL_RULES = {
+    "fr": _fr_plural,
+    "ru": _ru_plural,
+    "ar": _ar_plural,
+}
+
+
+class _KeyTrie:
+    """
+    Trie over dotted translation keys, one node per dot segment.
+
+    Segment-level fanout keeps the tree shallow (3-4 levels for typical
+    keys) and supports prefix enumeration — e.g. all of 'guardian.login.*'
+    — in O(subtree) without scanning the whole key space.
+    """
+
+    __slots__ = ("children", "value")
+
+    def __init__(self):
+        self.children: Dict[str, "_KeyTrie"] = {}
+        self.value: Optional[str] = None
+
+    def insert(self, key: str, value: str) -> None:
+        """Insert a dotted key and its translation."""
+        node = self
+        for segment in key.split("."):
+            node = node.children.setdefault(segment, _KeyTrie())
+        node.value = value
+
+    def find(self, key: str) -> Optional["_KeyTrie"]:
+        """Return the node for a dotted key/prefix, or None."""
+        node = self
+        for segment in key.split("."):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def iter_prefix(self, prefix: str = ""):
+        """Yield (key, value) pairs for every key under the given prefix."""
+        start = self if not prefix else self.find(prefix)
+        if start is None:
+            return
+
+        stack = [(prefix, start)]
+        while stack:
+            path, node = stack.pop()
+            if node.value is not None:
+                yield path, node.value
+            for segment, child in node.children.items():
+                stack.append((f"{path}.{segment}" if path else segment, child))
+
+
+# Supported locales as module constants so per-request paths never
+# rebuild the list or the membership set; read-only views keep the
+# shared entries safe to hand out without copying
+_AVAILABLE_LOCALES = tuple(MappingProxyType(loc) for loc in (
+    {"code": "en", "name": "English", "native_name": "English"},
+    {"code": "pt", "name": "Portuguese", "native_name": "Português"},
+    {"code": "es", "name": "Spanish", "native_name": "Español"},
+    {"code": "fr", "name": "French", "native_name": "Français"},
+    {"code": "de", "name": "German", "native_name": "Deutsch"},
+))
+_AVAILABLE_CODE_SET = frozenset(loc["code"] for loc in _AVAILABLE_LOCALES)
+
+# Primary language subtags in an Accept-Language header: the run of
+# letters at the start of each comma-separated entry (region subtags
+# after '-' and q-weights are never matched)
+_LANG_RE = re.compile(r"(?:^|,)\s*([A-Za-z]{1,8})")
+
+
+@lru_cache(maxsize=256)
+def _base_locale(tag: str) -> str:
+    """
+    Base language of a locale tag ('pt-BR' -> 'pt'), memoized and interned.
+
+    Only dozens of distinct tags ever flow through a deployment, so this
+    avoids the per-call partition allocation and keeps the result interned
+    for identity-fast dict lookups.
+    """
+    return sys.intern(tag.partition("-")[0])
+
+
+@lru_cache(maxsize=8192)
+def _plural_key(base: str, form: str) -> str:
+    """
+    Build '{base}.{form}', memoized per (base, form) pair.
+
+    Plural keys recur constantly for the same handful of labels and
+    forms, so repeat calls reuse the already-built string (which also
+    keeps it a cache-friendly identity match in the flat-map lookup).
+    """
+    return f"{base}.{form}"
+
+
+_PARAM_RE = re.compile(r"\{(\w+)\}")
+
+# A template is format_map-safe when every brace belongs to a simple
+# {name} placeholder — no stray braces, no format specs
+_SIMPLE_TEMPLATE_RE = re.compile(r"(?:[^{}]|\{\w+\})*\Z")
+
+
+class _DefaultingParams(dict):
+    """Mapping for str.format_map that leaves unknown placeholders intact."""
+
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+@lru_cache(maxsize=4096)
+def _compile_template(template: str):
+    """
+    Pre-parse an interpolation template.
+
+    Returns None when the template contains no placeholders (the common
+    case for labels), the template itself when C-level str.format_map can
+    substitute it safely, or a tuple of (literal, name, ..., literal)
+    segments for templates with braces format_map would reject. Templates
+    come from the bounded translation store, so the cache converges
+    quickly.
+    """
+    parts = _PARAM_RE.split(template)
+    if len(parts) == 1:
+        return None
+    if _SIMPLE_TEMPLATE_RE.match(template):
+        return template
+    return tuple(parts)
+
+
 class EchoesService:
     """
     Translation service for the Spark Framework.
@@ -39,9 +264,42 @@ class EchoesService:
         """
         self._default_locale = default_locale
         self._translations: Dict[str, Dict[str, Any]] = {}
+        # Flat dotted-key map per locale: the store is write-rare and
+        # read-heavy, so lookups pay one dict.get instead of an O(depth)
+        # walk through nested dicts
+        self._flat: Dict[str, Dict[str, str]] = {}
+        # Resolved (locale, key) -> text for parameterless lookups; most
+        # UI labels are translated repeatedly per request with no params
+        self._translate_cache: Dict[tuple, str] = {}
+        self._by_module: Dict[tuple, Dict[str, Any]] = {}
+        # Per-locale key trie for namespace/prefix enumeration
+        self._key_tries: Dict[str, _KeyTrie] = {}
         self._loaded_locales: set = set()
+        # Locales for which both the locale itself and the default
+        # fallback are loaded — one membership test on the translate path
+        self._ready_locales: set = set()
         self._registered_modules: set = set()
         self._modules_path: Optional[Path] = None
+        # Translation files per locale, discovered in one directory walk;
+        # avoids re-running iterdir() + two exists() stats per module for
+        # every locale that gets loaded
+        self._module_files_cache: Optional[Dict[str, List[Path]]] = None
+
+        # Babel availability never changes after import, so pick each
+        # formatter implementation once here instead of re-testing
+        # BABEL_AVAILABLE on every call
+        if BABEL_AVAILABLE:
+            self.format_date = self._format_date_babel
+            self.format_datetime = self._format_datetime_babel
+            self.format_number = self._format_number_babel
+            self.format_currency = self._format_currency_babel
+            self.format_percent = self._format_percent_babel
+        else:
+            self.format_date = self._format_date_fallback
+            self.format_datetime = self._format_datetime_fallback
+            self.format_number = self._format_number_fallback
+            self.format_currency = self._format_currency_fallback
+            self.format_percent = self._format_percent_fallback
 
     @property
     def default_locale(self) -> str:
@@ -52,6 +310,10 @@ class EchoesService:
     def default_locale(self, value: str) -> None:
         """Set the default locale."""
         self._default_locale = value
+        # The new fallback may not be loaded yet, and cached results
+        # resolved through the old fallback are now stale
+        self._ready_locales.clear()
+        self._translate_cache.clear()
 
     def set_modules_path(self, path: Path) -> None:
         """
@@ -61,6 +323,7 @@ class EchoesService:
             path: Path to the modules directory
         """
         self._modules_path = path
+        self._module_files_cache = None
 
     def load_translations(self, locale: str) -> None:
         """
@@ -72,28 +335,193 @@ class EchoesService:
         if locale in self._loaded_locales:
             return
 
+        # Locale codes are used constantly as dict keys; interning makes
+        # subsequent lookups and comparisons identity checks
+        locale = sys.intern(locale)
+
         self._translations[locale] = {}
 
         if self._modules_path is None:
             # Default to looking for locales relative to this file
             self._modules_path = Path(__file__).parent.parent.parent
 
-        # Load translations from each registered module
-        for module_dir in self._modules_path.iterdir():
-            if not module_dir.is_dir():
+        # Discover every module's translation files once; subsequent locale
+        # loads only open files that are known to exist
+        if self._module_files_cache is None:
+            self._module_files_cache = self._discover_translation_files()
+
+        file_paths = self._module_files_cache.get(locale, [])
+        if len(file_paths) > 1:
+            # Read + parse in parallel: the GIL is released during file
+            # reads and orjson decoding, then merge on the calling thread
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                parsed = list(executor.map(self._read_translation_file, file_paths))
+            for module_translations in parsed:
+                if module_translations:
+                    self._merge_translations(locale, module_translations)
+        else:
+            for file_path in file_paths:
+                self._load_translation_file(locale, file_path)
+
+        self._loaded_locales.add(locale)
+        self._flatten_locale(locale)
+        self._rebuild_module_index(locale)
+
+    def _discover_translation_files(self) -> Dict[str, List[Path]]:
+        """
+        Walk the modules directory once and collect translation files.
+
+        Checks the same two candidate locations per module as before
+        ({module}-be/locales and a direct locales folder), but with
+        os.scandir instead of per-locale iterdir()/exists() stat calls.
+
+        Returns:
+            Dict mapping locale codes to the files that provide them
+        """
+        files: Dict[str, List[Path]] = {}
+
+        try:
+            module_entries = list(os.scandir(self._modules_path))
+        except OSError:
+            return files
+
+        for module_entry in module_entries:
+            if not module_entry.is_dir():
                 continue
 
-            # Look for backend locales
-            be_locales_path = module_dir / f"{module_dir.name}-be" / "locales" / f"{locale}.json"
-            if be_locales_path.exists():
-                self._load_translation_file(locale, be_locales_path)
+            candidates = (
+                os.path.join(module_entry.path, f"{module_entry.name}-be", "locales"),
+                os.path.join(module_entry.path, "locales"),
+            )
+            for locales_dir in candidates:
+                try:
+                    entries = os.scandir(locales_dir)
+                except OSError:
+                    continue
 
-            # Also check direct locales folder
-            locales_path = module_dir / "locales" / f"{locale}.json"
-            if locales_path.exists():
-                self._load_translation_file(locale, locales_path)
+                with entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.name.endswith(".json"):
+                            locale = sys.intern(entry.name[:-5])
+                            files.setdefault(locale, []).append(Path(entry.path))
 
-        self._loaded_locales.add(locale)
+        return files
+
+    def _ensure_loaded(self, locale: str) -> None:
+        """
+        Make sure a locale and the default fallback are both loaded.
+
+        Collapses the two load_translations calls the translate paths used
+        to make per invocation into a single set-membership check.
+
+        Args:
+            locale: The locale about to be read
+        """
+        if locale in self._ready_locales:
+            return
+
+        self.load_translations(locale)
+        self.load_translations(self._default_locale)
+        self._ready_locales.add(locale)
+
+    def _flatten_locale(self, locale: str) -> None:
+        """
+        Rebuild the flat dotted-key map for a locale.
+
+        Walks the (possibly nested) translation dict with an explicit
+        stack and emits one flat entry per string leaf, so translate
+        lookups become a single dict access.
+
+        Args:
+            locale: The locale to flatten
+        """
+        flat: Dict[str, str] = {}
+        stack = [((), self._translations.get(locale, {}))]
+
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                if isinstance(value, dict):
+                    stack.append((prefix + (key,), value))
+                elif isinstance(value, str):
+                    flat[".".join(prefix + (key,))] = value
+
+        self._flat[locale] = flat
+
+        # Rebuild the prefix trie alongside the flat map
+        trie = _KeyTrie()
+        for key, value in flat.items():
+            trie.insert(key, value)
+        self._key_tries[locale] = trie
+
+    def _rebuild_module_index(self, locale: str) -> None:
+        """
+        Rebuild the per-module key index for a locale.
+
+        Groups translation keys by their module prefix (the first dotted
+        segment) so module-filtered lookups are a single dict access
+        instead of a scan over every key.
+
+        Args:
+            locale: The locale to index
+        """
+        # Drop stale entries for this locale before re-indexing
+        for index_key in [k for k in self._by_module if k[0] == locale]:
+            del self._by_module[index_key]
+
+        for key, value in self._translations.get(locale, {}).items():
+            prefix, sep, _ = key.partition(".")
+            if sep:
+                self._by_module.setdefault((locale, prefix), {})[key] = value
+
+    def get_module_translations(self, locale: str, module_name: str) -> Dict[str, Any]:
+        """
+        Get translations for a single module within a locale.
+
+        Args:
+            locale: The locale code
+            module_name: The module prefix (e.g. 'guardian')
+
+        Returns:
+            Dictionary of the module's translations, empty if none
+        """
+        self.load_translations(locale)
+        return self._by_module.get((locale, module_name), {})
+
+    def _read_translation_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Read and parse a single translation file.
+
+        Touches no shared state, so it is safe to run on a worker thread.
+
+        Args:
+            file_path: Path to the JSON translation file
+
+        Returns:
+            Parsed translations, or None on error
+        """
+        try:
+            # orjson decodes UTF-8 bytes directly (C decoder); stdlib
+            # json is the fallback when it is not installed
+            with open(file_path, "rb") as f:
+                if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                    # Large blobs: map the file and hand orjson a view of
+                    # the pages directly, skipping the read() copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return _json_loads(memoryview(mm))
+                return _json_loads(f.read())
+        except (ValueError, IOError) as e:
+            # Log error but don't fail - translations may be partial;
+            # %s-style lazy formatting renders nothing when filtered out
+            logger.warning("Failed to load translations from %s: %s", file_path, e)
+            return None
+
+    def _merge_translations(self, locale: str, module_translations: Dict[str, Any]) -> None:
+        """Merge parsed translations into the locale store."""
+        if locale not in self._translations:
+            self._translations[locale] = {}
+        self._translations[locale].update(module_translations)
+        self._translate_cache.clear()
 
     def _load_translation_file(self, locale: str, file_path: Path) -> None:
         """
@@ -103,15 +531,45 @@ class EchoesService:
             locale: The locale being loaded
             file_path: Path to the JSON translation file
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                module_translations = json.load(f)
-                if locale not in self._translations:
-                    self._translations[locale] = {}
-                self._translations[locale].update(module_translations)
-        except (json.JSONDecodeError, IOError) as e:
-            # Log error but don't fail - translations may be partial
-            print(f"Warning: Failed to load translations from {file_path}: {e}")
+        module_translations = self._read_translation_file(file_path)
+        if module_translations:
+            self._merge_translations(locale, module_translations)
+
+    def _deep_merge_and_flatten(
+        self,
+        dest: Dict[str, Any],
+        flat: Dict[str, str],
+        trie: _KeyTrie,
+        src: Dict[str, Any],
+        prefix: tuple = ()
+    ) -> None:
+        """
+        Deep-merge src into dest, updating the flat map and trie in the
+        same walk.
+
+        Nested namespaces are merged key by key instead of clobbered
+        wholesale, and the flat index is updated incrementally — O(keys
+        in src), not O(all keys in the locale).
+
+        Args:
+            dest: Nested destination dict (mutated in place)
+            flat: Flat dotted-key map for the locale (mutated in place)
+            trie: Prefix trie for the locale (mutated in place)
+            src: Nested source dict to merge in
+            prefix: Dot-path segments leading to this level
+        """
+        for key, value in src.items():
+            if isinstance(value, dict):
+                node = dest.get(key)
+                if not isinstance(node, dict):
+                    node = dest[key] = {}
+                self._deep_merge_and_flatten(node, flat, trie, value, prefix + (key,))
+            else:
+                dest[key] = value
+                if isinstance(value, str):
+                    flat_key = ".".join(prefix + (key,))
+                    flat[flat_key] = value
+                    trie.insert(flat_key, value)
 
     def register_module_translations(
         self,
@@ -127,12 +585,17 @@ class EchoesService:
                          e.g., {'en': {'guardian': {...}}, 'pt': {'guardian': {...}}}
         """
         self._registered_modules.add(module_name)
+        self._translate_cache.clear()
 
         for locale, locale_translations in translations.items():
-            if locale not in self._translations:
-                self._translations[locale] = {}
-            self._translations[locale].update(locale_translations)
+            dest = self._translations.setdefault(locale, {})
+            flat = self._flat.setdefault(locale, {})
+            trie = self._key_tries.setdefault(locale, _KeyTrie())
+            # Single-pass deep merge: previously a shallow update() here
+            # silently clobbered nested namespaces shared between modules
+            self._deep_merge_and_flatten(dest, flat, trie, locale_translations)
             self._loaded_locales.add(locale)
+            self._rebuild_module_index(locale)
 
     def translate(
         self,
@@ -148,33 +611,93 @@ class EchoesService:
             locale: Target locale (defaults to default_locale)
             params: Interpolation parameters (e.g., {'name': 'John'})
 
+        Returns:
+            Translated string, or key marker if not found
+        """
+        value = self.translate_raw(key, locale)
+
+        # Interpolate parameters
+        if params:
+            value = self._interpolate(value, params)
+
+        return value
+
+    def translate_raw(self, key: str, locale: str = None) -> str:
+        """
+        Translate a key without parameter interpolation.
+
+        Fast path for the overwhelmingly common case of plain labels and
+        menu items: pure lookup plus fallback, no format machinery.
+
+        Args:
+            key: Translation key using dot notation
+            locale: Target locale (defaults to default_locale)
+
         Returns:
             Translated string, or key marker if not found
         """
         if locale is None:
             locale = self._default_locale
 
+        cache_key = (locale, key)
+        cached = self._translate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Ensure translations are loaded
-        self.load_translations(locale)
-        self.load_translations(self._default_locale)
+        self._ensure_loaded(locale)
 
-        # Try locale first, then fallback to default
-        value = self._get_nested_value(self._translations.get(locale, {}), key)
+        # Try locale first, then fallback to default — one flat-map get each
+        value = self._flat.get(locale, {}).get(key)
         if value is None:
-            value = self._get_nested_value(
-                self._translations.get(self._default_locale, {}),
-                key
-            )
+            value = self._flat.get(self._default_locale, {}).get(key)
 
         if value is None:
-            return f"[{key}]"  # Missing translation marker
-
-        # Interpolate parameters
-        if params:
-            value = self._interpolate(value, params)
+            # Missing translation marker — never cached: key and locale
+            # are caller-controlled, so memoizing misses would let
+            # arbitrary probes grow the cache without bound
+            return f"[{key}]"
 
+        self._translate_cache[cache_key] = value
         return value
 
+    def translate_many(
+        self,
+        keys: List[str],
+        locale: str = None
+    ) -> Dict[str, str]:
+        """
+        Translate multiple keys in one pass.
+
+        Loads the locale and fallback dictionaries once and resolves every
+        key against them, instead of paying the per-call setup of
+        translate() for each key.
+
+        Args:
+            keys: Translation keys using dot notation
+            locale: Target locale (defaults to default_locale)
+
+        Returns:
+            Dictionary mapping each key to its translation (or the
+            missing-translation marker)
+        """
+        if locale is None:
+            locale = self._default_locale
+
+        self._ensure_loaded(locale)
+
+        primary = self._flat.get(locale, {})
+        fallback = self._flat.get(self._default_locale, {})
+
+        result = {}
+        for key in keys:
+            value = primary.get(key)
+            if value is None:
+                value = fallback.get(key)
+            result[key] = value if value is not None else f"[{key}]"
+
+        return result
+
     def translate_plural(
         self,
         key: str,
@@ -202,18 +725,31 @@ class EchoesService:
         if locale is None:
             locale = self._default_locale
 
+        self._ensure_loaded(locale)
+
         plural_form = self._get_plural_form(count, locale)
-        plural_key = f"{key}.{plural_form}"
+        primary = self._flat.get(locale, {})
+        fallback = self._flat.get(self._default_locale, {})
+
+        # Resolve the specific form, then 'other', against the flat maps
+        # directly — one combined lookup chain instead of a second full
+        # translate() round trip on miss
+        plural_key = _plural_key(key, plural_form)
+        template = primary.get(plural_key)
+        if template is None:
+            template = fallback.get(plural_key)
+
+        if template is None and plural_form != "other":
+            plural_key = _plural_key(key, "other")
+            template = primary.get(plural_key)
+            if template is None:
+                template = fallback.get(plural_key)
+
+        if template is None:
+            return f"[{plural_key}]"  # Missing translation marker
 
         all_params = {"count": count, **(params or {})}
-
-        result = self.translate(plural_key, locale, all_params)
-
-        # Fallback to 'other' if specific form not found
-        if result.startswith("[") and plural_form != "other":
-            result = self.translate(f"{key}.other", locale, all_params)
-
-        return result
+        return self._interpolate(template, all_params)
 
     def has_translation(self, key: str, locale: str = None) -> bool:
         """
@@ -230,7 +766,29 @@ class EchoesService:
             locale = self._default_locale
 
         self.load_translations(locale)
-        return self._get_nested_value(self._translations.get(locale, {}), key) is not None
+        return key in self._flat.get(locale, {})
+
+    def iter_prefix(self, prefix: str, locale: str = None):
+        """
+        Iterate (key, value) pairs for every translation under a prefix.
+
+        Example: iter_prefix('guardian.login') yields the whole
+        'guardian.login.*' namespace without scanning unrelated keys.
+
+        Args:
+            prefix: Dotted key prefix ('' for all keys)
+            locale: Locale to enumerate (defaults to default_locale)
+
+        Yields:
+            (key, translation) tuples
+        """
+        if locale is None:
+            locale = self._default_locale
+
+        self.load_translations(locale)
+        trie = self._key_tries.get(locale)
+        if trie is not None:
+            yield from trie.iter_prefix(prefix)
 
     def _get_plural_form(self, count: int, locale: str) -> str:
         """
@@ -245,64 +803,10 @@ class EchoesService:
         Returns:
             Plural form: 'zero', 'one', 'two', 'few', 'many', or 'other'
         """
-        base_locale = locale.split("-")[0] if "-" in locale else locale
-
         if count == 0:
             return "zero"
 
-        # French: 0 and 1 are singular
-        if base_locale == "fr":
-            return "one" if count in (0, 1) else "other"
-
-        # Russian: complex rules
-        if base_locale == "ru":
-            mod10 = count % 10
-            mod100 = count % 100
-            if mod10 == 1 and mod100 != 11:
-                return "one"
-            if 2 <= mod10 <= 4 and not (12 <= mod100 <= 14):
-                return "few"
-            return "many"
-
-        # Arabic: most complex
-        if base_locale == "ar":
-            if count == 0:
-                return "zero"
-            if count == 1:
-                return "one"
-            if count == 2:
-                return "two"
-            mod100 = count % 100
-            if 3 <= mod100 <= 10:
-                return "few"
-            if 11 <= mod100:
-                return "many"
-            return "other"
-
-        # Default (English, Portuguese, Spanish, German, Italian, etc.)
-        return "one" if count == 1 else "other"
-
-    def _get_nested_value(self, data: Dict, key: str) -> Optional[str]:
-        """
-        Get a nested value from a dict using dot notation.
-
-        Args:
-            data: The dictionary to search
-            key: Dot-notated key (e.g., 'guardian.login.title')
-
-        Returns:
-            The value if found, None otherwise
-        """
-        keys = key.split(".")
-        value = data
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return None
-
-        return value if isinstance(value, str) else None
+        return _PLURAL_RULES.get(_base_locale(locale), _default_plural)(count)
 
     def _interpolate(self, template: str, params: Dict[str, Any]) -> str:
         """
@@ -317,14 +821,30 @@ class EchoesService:
         Returns:
             Interpolated string
         """
-        def replace_param(match):
-            param_name = match.group(1)
-            value = params.get(param_name)
-            return str(value) if value is not None else match.group(0)
+        compiled = _compile_template(template)
+        if compiled is None:
+            # No placeholders — nothing to do
+            return template
+
+        if type(compiled) is str:
+            # C-level substitution; None-valued params keep their
+            # placeholder, matching the segment path below
+            return compiled.format_map(_DefaultingParams(
+                (name, value) for name, value in params.items() if value is not None
+            ))
+
+        # Odd indexes are parameter names, even indexes literal text
+        out = []
+        for index, segment in enumerate(compiled):
+            if index & 1:
+                value = params.get(segment)
+                out.append(str(value) if value is not None else "{" + segment + "}")
+            else:
+                out.append(segment)
 
-        return re.sub(r"\{(\w+)\}", replace_param, template)
+        return "".join(out)
 
-    def format_date(
+    def _format_date_babel(
         self,
         value: datetime | date | str,
         locale: str = None,
@@ -345,16 +865,23 @@ class EchoesService:
             locale = self._default_locale
 
         if isinstance(value, str):
-            value = datetime.fromisoformat(value)
+            value = _parse_iso(value)
+
+        return dates.format_date(value, format=format, locale=_babel_locale(locale))
 
-        if not BABEL_AVAILABLE:
-            # Fallback without babel
-            return value.strftime("%Y-%m-%d")
+    def _format_date_fallback(
+        self,
+        value: datetime | date | str,
+        locale: str = None,
+        format: str = "medium"
+    ) -> str:
+        """Format a date without Babel (ISO layout)."""
+        if isinstance(value, str):
+            value = _parse_iso(value)
 
-        babel_locale = Locale.parse(locale.replace("-", "_"))
-        return dates.format_date(value, format=format, locale=babel_locale)
+        return value.strftime("%Y-%m-%d")
 
-    def format_datetime(
+    def _format_datetime_babel(
         self,
         value: datetime | str,
         locale: str = None,
@@ -375,15 +902,23 @@ class EchoesService:
             locale = self._default_locale
 
         if isinstance(value, str):
-            value = datetime.fromisoformat(value)
+            value = _parse_iso(value)
 
-        if not BABEL_AVAILABLE:
-            return value.strftime("%Y-%m-%d %H:%M:%S")
+        return dates.format_datetime(value, format=format, locale=_babel_locale(locale))
 
-        babel_locale = Locale.parse(locale.replace("-", "_"))
-        return dates.format_datetime(value, format=format, locale=babel_locale)
+    def _format_datetime_fallback(
+        self,
+        value: datetime | str,
+        locale: str = None,
+        format: str = "medium"
+    ) -> str:
+        """Format a datetime without Babel (ISO layout)."""
+        if isinstance(value, str):
+            value = _parse_iso(value)
 
-    def format_number(
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _format_number_babel(
         self,
         value: float | int,
         locale: str = None,
@@ -403,20 +938,27 @@ class EchoesService:
         if locale is None:
             locale = self._default_locale
 
-        if not BABEL_AVAILABLE:
-            if decimal_places is not None:
-                return f"{value:,.{decimal_places}f}"
-            return f"{value:,}"
-
-        babel_locale = Locale.parse(locale.replace("-", "_"))
+        babel_locale = _babel_locale(locale)
 
         if decimal_places is not None:
-            format_str = f"#,##0.{'0' * decimal_places}"
-            return numbers.format_decimal(value, format=format_str, locale=babel_locale)
+            return numbers.format_decimal(
+                value, format=_decimal_pattern(decimal_places), locale=babel_locale
+            )
 
         return numbers.format_decimal(value, locale=babel_locale)
 
-    def format_currency(
+    def _format_number_fallback(
+        self,
+        value: float | int,
+        locale: str = None,
+        decimal_places: Optional[int] = None
+    ) -> str:
+        """Format a number without Babel (en-style grouping)."""
+        if decimal_places is not None:
+            return f"{value:,.{decimal_places}f}"
+        return f"{value:,}"
+
+    def _format_currency_babel(
         self,
         value: float | int,
         locale: str = None,
@@ -436,13 +978,18 @@ class EchoesService:
         if locale is None:
             locale = self._default_locale
 
-        if not BABEL_AVAILABLE:
-            return f"{currency} {value:,.2f}"
+        return numbers.format_currency(value, currency, locale=_babel_locale(locale))
 
-        babel_locale = Locale.parse(locale.replace("-", "_"))
-        return numbers.format_currency(value, currency, locale=babel_locale)
+    def _format_currency_fallback(
+        self,
+        value: float | int,
+        locale: str = None,
+        currency: str = "USD"
+    ) -> str:
+        """Format a currency value without Babel."""
+        return f"{currency} {value:,.2f}"
 
-    def format_percent(
+    def _format_percent_babel(
         self,
         value: float,
         locale: str = None,
@@ -462,11 +1009,16 @@ class EchoesService:
         if locale is None:
             locale = self._default_locale
 
-        if not BABEL_AVAILABLE:
-            return f"{value * 100:.{decimal_places}f}%"
+        return numbers.format_percent(value, locale=_babel_locale(locale))
 
-        babel_locale = Locale.parse(locale.replace("-", "_"))
-        return numbers.format_percent(value, locale=babel_locale)
+    def _format_percent_fallback(
+        self,
+        value: float,
+        locale: str = None,
+        decimal_places: int = 0
+    ) -> str:
+        """Format a percentage without Babel."""
+        return f"{value * 100:.{decimal_places}f}%"
 
     def get_available_locales(self) -> List[Dict[str, str]]:
         """
@@ -475,13 +1027,7 @@ class EchoesService:
         Returns:
             List of locale dicts with 'code', 'name', 'native_name'
         """
-        return [
-            {"code": "en", "name": "English", "native_name": "English"},
-            {"code": "pt", "name": "Portuguese", "native_name": "Português"},
-            {"code": "es", "name": "Spanish", "native_name": "Español"},
-            {"code": "fr", "name": "French", "native_name": "Français"},
-            {"code": "de", "name": "German", "native_name": "Deutsch"},
-        ]
+        return list(_AVAILABLE_LOCALES)
 
     def detect_locale(self, accept_language: Optional[str]) -> str:
         """
@@ -493,15 +1039,14 @@ class EchoesService:
         Returns:
             Best matching locale code
         """
-        available = [loc["code"] for loc in self.get_available_locales()]
-
         if not accept_language:
             return self._default_locale
 
-        # Parse Accept-Language header
-        for lang in accept_language.split(","):
-            code = lang.split(";")[0].strip().split("-")[0]
-            if code in available:
+        # One regex pass over the header; each primary subtag is checked
+        # against the precomputed frozenset of supported codes
+        for match in _LANG_RE.finditer(accept_language):
+            code = match.group(1).lower()
+            if code in _AVAILABLE_CODE_SET:
                 return code
 
         return self._default_locale
@@ -517,21 +1062,27 @@ class EchoesService:
     def clear_cache(self) -> None:
         """Clear all cached translations."""
         self._translations.clear()
+        self._flat.clear()
+        self._translate_cache.clear()
+        self._by_module.clear()
+        self._key_tries.clear()
         self._loaded_locales.clear()
+        self._ready_locales.clear()
+        # Force a fresh directory scan on the next load so files added
+        # since the last discovery are picked up
+        self._module_files_cache = None
 
 
-# Singleton instance
-_echoes_service: Optional[EchoesService] = None
-
-
+@cache
 def get_echoes_service() -> EchoesService:
     """
     Get the singleton EchoesService instance.
 
+    Memoized via functools.cache: after the first call this is a single
+    C-level dict lookup, with no module global or None check. Tests can
+    reset the singleton with get_echoes_service.cache_clear().
+
     Returns:
         The EchoesService singleton
     """
-    global _echoes_service
-    if _echoes_service is None:
-        _echoes_service = EchoesService()
-    return _echoes_service
+    return EchoesService()